@@ -1,7 +1,9 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-from pathlib import Path
+import re
+import threading
+import uuid
 from name_sanitizer import FilenameSanitizer
 from content_extractors import ContentExtractorManager
 
@@ -14,6 +16,17 @@ class RenamerApp(tk.Tk):
         self.directory = ""
         self.files = []
         self.extractor_manager = ContentExtractorManager()
+        # As extensões suportadas não mudam em runtime; formatar uma vez
+        supported_exts = self.extractor_manager.get_supported_extensions()
+        self._supported_exts_str = ", ".join(sorted(supported_exts))
+
+        # Persistente entre trocas de opção (os widgets são recriados)
+        self.replace_regex_var = tk.BooleanVar(value=False)
+
+        # Estado da varredura incremental de diretório
+        self._scan_iter = None
+        self._scan_names = []
+        self._scan_token = 0
 
         # --- Layout ---
         self.grid_columnconfigure(0, weight=1)
@@ -50,9 +63,9 @@ class RenamerApp(tk.Tk):
         self.file_listbox = tk.Listbox(files_frame, selectmode="extended")
         self.file_listbox.grid(row=0, column=0, sticky="nsew")
 
-        files_scrollbar = ttk.Scrollbar(files_frame, orient="vertical", command=self.file_listbox.yview)
-        files_scrollbar.grid(row=0, column=1, sticky="ns")
-        self.file_listbox.config(yscrollcommand=files_scrollbar.set)
+        self.files_scrollbar = ttk.Scrollbar(files_frame, orient="vertical", command=self.file_listbox.yview)
+        self.files_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.file_listbox.config(yscrollcommand=self.files_scrollbar.set)
 
         # Botões de seleção de arquivos
         selection_buttons_frame = ttk.Frame(files_frame)
@@ -79,6 +92,7 @@ class RenamerApp(tk.Tk):
         # --- Frame para inputs das opções ---
         self.option_inputs_frame = ttk.Frame(rename_options_frame, padding="5 10 5 5")
         self.option_inputs_frame.pack(fill="x", expand=True)
+        self._option_frames = self._build_option_frames()
 
         # --- Opções de Sanitização ---
         sanitize_options_frame = ttk.Labelframe(options_column_frame, text="Opções de Finalização", padding="10")
@@ -104,53 +118,73 @@ class RenamerApp(tk.Tk):
         )
         self.replace_spaces_check.pack(anchor="w")
 
-        self.create_option_widgets() # Chamar para criar os widgets da opção default
+        self.create_option_widgets() # Chamar para exibir os widgets da opção default
 
         # Botão de Renomear
-        rename_button = ttk.Button(self, text="Renomear Arquivos Selecionados", command=self.rename_files, style="Accent.TButton")
-        rename_button.grid(row=2, column=0, pady=10, padx=10, sticky="e")
+        self.rename_button = ttk.Button(self, text="Renomear Arquivos Selecionados", command=self.rename_files, style="Accent.TButton")
+        self.rename_button.grid(row=2, column=0, pady=10, padx=10, sticky="e")
 
         # Estilo
         style = ttk.Style(self)
         style.configure("Accent.TButton", foreground="white", background="blue")
 
-    def create_option_widgets(self):
-        # Limpa widgets antigos
-        for widget in self.option_inputs_frame.winfo_children():
-            widget.destroy()
-
-        option = self.rename_option.get()
+    def _build_option_frames(self):
+        """Cria os sub-frames de inputs de cada opção uma única vez.
+
+        Criar/destruir widgets a cada clique de radiobutton é caro no Tk;
+        a troca de opção apenas esconde/mostra o frame correspondente, e
+        de quebra o texto digitado sobrevive às trocas.
+        """
+        frames = {}
+
+        f = ttk.Frame(self.option_inputs_frame)
+        ttk.Label(f, text="Nome Base:").pack(anchor="w")
+        self.base_name_entry = ttk.Entry(f)
+        self.base_name_entry.pack(fill="x")
+        self.base_name_entry.insert(0, "arquivo_")
+        frames["sequential"] = f
+
+        f = ttk.Frame(self.option_inputs_frame)
+        ttk.Label(f, text="Prefixo:").pack(anchor="w")
+        self.prefix_entry = ttk.Entry(f)
+        self.prefix_entry.pack(fill="x")
+        ttk.Label(f, text="Sufixo:").pack(anchor="w")
+        self.suffix_entry = ttk.Entry(f)
+        self.suffix_entry.pack(fill="x")
+        frames["add_text"] = f
+
+        f = ttk.Frame(self.option_inputs_frame)
+        ttk.Label(f, text="Encontrar:").pack(anchor="w")
+        self.find_entry = ttk.Entry(f)
+        self.find_entry.pack(fill="x")
+        ttk.Label(f, text="Substituir por:").pack(anchor="w")
+        self.replace_entry = ttk.Entry(f)
+        self.replace_entry.pack(fill="x")
+        ttk.Checkbutton(
+            f,
+            text="Usar Regex",
+            variable=self.replace_regex_var
+        ).pack(anchor="w", pady=(5, 0))
+        frames["replace"] = f
+
+        frames["folder_name_seq"] = ttk.Frame(self.option_inputs_frame)  # sem inputs
+
+        f = ttk.Frame(self.option_inputs_frame)
+        ttk.Label(f, text="Extrai o nome do conteúdo do arquivo.").pack(anchor="w")
+        ttk.Label(f, text=f"Suportado: {self._supported_exts_str}", wraplength=250).pack(anchor="w", pady=(5,5))
+        ttk.Label(f, text="Padrão Regex (Opcional):").pack(anchor="w")
+        self.regex_entry = ttk.Entry(f)
+        self.regex_entry.pack(fill="x")
+        ttk.Label(f, text="Usa o 1º grupo de captura do regex.").pack(anchor="w")
+        frames["extract_content"] = f
+
+        return frames
 
-        if option == "sequential":
-            ttk.Label(self.option_inputs_frame, text="Nome Base:").pack(anchor="w")
-            self.base_name_entry = ttk.Entry(self.option_inputs_frame)
-            self.base_name_entry.pack(fill="x")
-            self.base_name_entry.insert(0, "arquivo_")
-        elif option == "add_text":
-            ttk.Label(self.option_inputs_frame, text="Prefixo:").pack(anchor="w")
-            self.prefix_entry = ttk.Entry(self.option_inputs_frame)
-            self.prefix_entry.pack(fill="x")
-            ttk.Label(self.option_inputs_frame, text="Sufixo:").pack(anchor="w")
-            self.suffix_entry = ttk.Entry(self.option_inputs_frame)
-            self.suffix_entry.pack(fill="x")
-        elif option == "replace":
-            ttk.Label(self.option_inputs_frame, text="Encontrar:").pack(anchor="w")
-            self.find_entry = ttk.Entry(self.option_inputs_frame)
-            self.find_entry.pack(fill="x")
-            ttk.Label(self.option_inputs_frame, text="Substituir por:").pack(anchor="w")
-            self.replace_entry = ttk.Entry(self.option_inputs_frame)
-            self.replace_entry.pack(fill="x")
-        elif option == "extract_content":
-            ttk.Label(self.option_inputs_frame, text="Extrai o nome do conteúdo do arquivo.").pack(anchor="w")
-
-            supported_exts = self.extractor_manager.get_supported_extensions()
-            ext_str = ", ".join(sorted(list(supported_exts)))
-            ttk.Label(self.option_inputs_frame, text=f"Suportado: {ext_str}", wraplength=250).pack(anchor="w", pady=(5,5))
-
-            ttk.Label(self.option_inputs_frame, text="Padrão Regex (Opcional):").pack(anchor="w")
-            self.regex_entry = ttk.Entry(self.option_inputs_frame)
-            self.regex_entry.pack(fill="x")
-            ttk.Label(self.option_inputs_frame, text="Usa o 1º grupo de captura do regex.").pack(anchor="w")
+    def create_option_widgets(self):
+        """Exibe o frame de inputs da opção de renomeação selecionada."""
+        for frame in self._option_frames.values():
+            frame.pack_forget()
+        self._option_frames[self.rename_option.get()].pack(fill="x", expand=True)
 
 
     def select_folder(self):
@@ -164,17 +198,81 @@ class RenamerApp(tk.Tk):
             self.folder_path_entry.config(state="readonly")
             self.load_files()
 
+    # Entradas consumidas do scandir por tick de after_idle
+    _SCAN_CHUNK = 500
+
     def load_files(self):
-        """Carrega os arquivos do diretório selecionado na listbox."""
+        """Carrega os arquivos do diretório selecionado na listbox.
+
+        A enumeração é incremental: consome o iterador do scandir em
+        blocos agendados com after_idle, mantendo a UI responsiva em
+        pastas enormes (ou montadas via rede). A lista é ordenada e
+        exibida ao final da varredura.
+        """
+        self._cancel_scan()
         self.file_listbox.delete(0, "end")
         self.files = []
-        if self.directory:
+        if not self.directory:
+            return
+
+        try:
+            self._scan_iter = os.scandir(self.directory)
+        except OSError as e:
+            messagebox.showerror("Erro", f"Não foi possível acessar a pasta: {e}")
+            return
+        self.after_idle(self._drain_scan, self._scan_token)
+
+    def _drain_scan(self, token):
+        """Consome um bloco do scandir e reagenda até esgotar."""
+        if token != self._scan_token or self._scan_iter is None:
+            return  # varredura cancelada/substituída
+
+        names = self._scan_names
+        try:
+            # scandir reutiliza o d_type retornado pelo kernel;
+            # com follow_symlinks=False, is_file() não faz nenhum
+            # stat() extra por entrada.
+            consumed = 0
+            for entry in self._scan_iter:
+                if entry.is_file(follow_symlinks=False):
+                    names.append(entry.name)
+                consumed += 1
+                if consumed >= self._SCAN_CHUNK:
+                    self.after_idle(self._drain_scan, token)
+                    return
+        except OSError as e:
+            self._cancel_scan()
+            messagebox.showerror("Erro", f"Não foi possível acessar a pasta: {e}")
+            return
+
+        self._finish_scan()
+
+    def _finish_scan(self):
+        """Ordena os nomes coletados e popula a listbox de uma vez."""
+        self._scan_iter.close()
+        self._scan_iter = None
+        # key= é computado uma vez por nome (transformada decorada do
+        # sort), então a ordenação sem distinção de maiúsculas custa
+        # O(N) casefolds, não O(N log N) por comparação.
+        self.files = sorted(self._scan_names, key=str.casefold)
+        self._scan_names = []
+
+        # Uma única chamada ao Tcl em vez de um round-trip por item,
+        # com a scrollbar desconectada durante a carga
+        if self.files:
+            self.file_listbox.config(yscrollcommand="")
             try:
-                self.files = [f for f in os.listdir(self.directory) if os.path.isfile(os.path.join(self.directory, f))]
-                for f in sorted(self.files):
-                    self.file_listbox.insert("end", f)
-            except OSError as e:
-                messagebox.showerror("Erro", f"Não foi possível acessar a pasta: {e}")
+                self.file_listbox.insert("end", *self.files)
+            finally:
+                self.file_listbox.config(yscrollcommand=self.files_scrollbar.set)
+
+    def _cancel_scan(self):
+        """Aborta uma varredura em andamento (ex.: nova pasta escolhida)."""
+        self._scan_token += 1
+        if self._scan_iter is not None:
+            self._scan_iter.close()
+            self._scan_iter = None
+        self._scan_names = []
 
     def select_all(self):
         self.file_listbox.select_set(0, "end")
@@ -191,8 +289,6 @@ class RenamerApp(tk.Tk):
 
         selected_files = [self.file_listbox.get(i) for i in selected_indices]
         option = self.rename_option.get()
-        renamed_count = 0
-        errors = []
 
         if not messagebox.askyesno("Confirmar Renomeação", f"Você tem certeza que deseja renomear {len(selected_files)} arquivo(s)?"):
             return
@@ -213,62 +309,326 @@ class RenamerApp(tk.Tk):
             conflict_resolution=True
         )
 
-        for i, filename in enumerate(selected_files):
-            try:
-                old_path = os.path.join(self.directory, filename)
-                name, ext = os.path.splitext(filename)
-                proposed_new_name = ""
-
-                if option == "sequential":
-                    base_name = self.base_name_entry.get()
-                    proposed_new_name = f"{base_name}{i+1:03d}{ext}"
-                elif option == "add_text":
-                    prefix = self.prefix_entry.get()
-                    suffix = self.suffix_entry.get()
-                    proposed_new_name = f"{prefix}{name}{suffix}{ext}"
-                elif option == "replace":
-                    find_text = self.find_entry.get()
-                    replace_text = self.replace_entry.get()
-                    if find_text:
-                        proposed_new_name = name.replace(find_text, replace_text) + ext
-                    else:
-                        proposed_new_name = filename
-                elif option == "folder_name_seq":
-                    folder_name = os.path.basename(self.directory)
-                    proposed_new_name = f"{folder_name}_{i+1:03d}{ext}"
-                elif option == "extract_content":
-                    file_path = Path(self.directory) / filename
-                    regex_pattern = self.regex_entry.get()
-
-                    extractor_kwargs = {}
-                    if regex_pattern:
-                        extractor_kwargs['regex_pattern'] = regex_pattern
-
-                    extracted_text = self.extractor_manager.extract_content(file_path, **extractor_kwargs)
-
-                    if extracted_text:
-                        proposed_new_name = f"{extracted_text}{ext}"
-                    else:
-                        errors.append(f"'{filename}': Não foi possível extrair conteúdo.")
-                        continue # Pula para o próximo arquivo
+        # Um snapshot do diretório permite checar conflitos em memória,
+        # sem um stat() por tentativa dentro do loop.
+        directory = self.directory
+        try:
+            existing_names = set(os.listdir(directory))
+        except OSError as e:
+            messagebox.showerror("Erro", f"Não foi possível acessar a pasta: {e}")
+            return
 
-                if not proposed_new_name:
-                    # Nenhum nome novo foi gerado, pular para o próximo.
-                    continue
+        # A extração de conteúdo roda na thread de trabalho; o dicionário
+        # é capturado pela closure e preenchido antes da fase de plano.
+        extracted = {}
+        extract_task = None
+        if option == "extract_content":
+            regex_pattern = self.regex_entry.get()
+            extractor_kwargs = {}
+            if regex_pattern:
+                # Compilar uma vez e repassar o objeto; padrão inválido
+                # é reportado antes de qualquer renomeação.
+                try:
+                    extractor_kwargs['regex_pattern'] = re.compile(regex_pattern, re.MULTILINE)
+                except re.error as e:
+                    messagebox.showerror("Erro", f"Padrão Regex inválido: {e}")
+                    return
+            extract_task = extractor_kwargs
+
+        # Cada builder lê os widgets da sua opção uma única vez — cada
+        # .get() é um round-trip ao Tcl — e devolve a closure de
+        # nomeação usada no loop; closures retornando None sinalizam
+        # "sem conteúdo extraível". Builders em vez de closures prontas
+        # para tocar apenas os widgets da opção ativa; devolver None do
+        # builder aborta o lote (erro já reportado).
+        # Contadores pré-formatados para as opções sequenciais: zfill é
+        # mais barato que a mini-linguagem do format por arquivo, e a
+        # largura cresce sozinha além de 999 itens.
+        def _make_counters():
+            width = max(3, len(str(len(selected_files))))
+            return [str(n).zfill(width) for n in range(1, len(selected_files) + 1)]
+
+        def _build_sequential():
+            base_name = self.base_name_entry.get()
+            if not base_name.strip():
+                messagebox.showwarning("Nome Base Vazio",
+                                       "Informe um nome base para a renomeação sequencial.")
+                return None
+            counters = _make_counters()
+
+            def propose(i, filename, name, ext):
+                return base_name + counters[i] + ext
+            return propose
+
+        def _build_add_text():
+            prefix = self.prefix_entry.get()
+            suffix = self.suffix_entry.get()
+
+            def propose(i, filename, name, ext):
+                return f"{prefix}{name}{suffix}{ext}"
+            return propose
+
+        def _build_replace():
+            find_text = self.find_entry.get()
+            replace_text = self.replace_entry.get()
+
+            # Sem texto a localizar nada mudaria; avisar e abortar antes
+            # de rodar o lote inteiro só para descobrir isso.
+            if not find_text:
+                messagebox.showwarning("Texto Vazio",
+                                       "Informe o texto a localizar para a substituição.")
+                return None
+
+            if self.replace_regex_var.get():
+                # Compilar uma vez fora do loop; padrão inválido é
+                # reportado antes de qualquer renomeação.
+                try:
+                    find_re = re.compile(find_text)
+                except re.error as e:
+                    messagebox.showerror("Erro", f"Padrão Regex inválido: {e}")
+                    return None
+
+                def propose(i, filename, name, ext):
+                    return find_re.sub(replace_text, name) + ext
+            else:
+                def propose(i, filename, name, ext):
+                    return name.replace(find_text, replace_text) + ext
+            return propose
+
+        def _build_folder_name_seq():
+            folder_name = os.path.basename(directory)
+            counters = _make_counters()
+
+            def propose(i, filename, name, ext):
+                return f"{folder_name}_{counters[i]}{ext}"
+            return propose
+
+        def _build_extract_content():
+            join = os.path.join
+
+            def propose(i, filename, name, ext):
+                extracted_text = extracted.get(join(directory, filename))
+                if extracted_text:
+                    return f"{extracted_text}{ext}"
+                return None
+            return propose
+
+        builders = {
+            "sequential": _build_sequential,
+            "add_text": _build_add_text,
+            "replace": _build_replace,
+            "folder_name_seq": _build_folder_name_seq,
+            "extract_content": _build_extract_content,
+        }
 
-                # Sanitizar e resolver conflitos
-                final_new_name = sanitizer.sanitize(proposed_new_name, directory=Path(self.directory))
+        builder = builders.get(option)
+        if builder is None:
+            return
+        propose = builder()
+        if propose is None:
+            return
 
-                if final_new_name != filename:
-                    new_path = os.path.join(self.directory, final_new_name)
-                    os.rename(old_path, new_path)
-                    renamed_count += 1
-                else:
-                    # O nome final sanitizado é o mesmo que o original
-                    errors.append(f"'{filename}': O nome gerado ('{proposed_new_name}') resultou no nome original após a finalização.")
+        # O lote roda numa thread de trabalho para a UI não congelar;
+        # os botões ficam desabilitados até o término — trocar de pasta
+        # no meio do lote deixaria _finish_rename aplicando as trocas de
+        # linha sobre uma listagem que não é mais a do lote.
+        self.rename_button.config(state="disabled")
+        self.browse_button.config(state="disabled")
+        threading.Thread(
+            target=self._run_rename_batch,
+            args=(directory, list(selected_indices), selected_files, propose,
+                  sanitizer, existing_names, extracted, extract_task),
+            daemon=True,
+        ).start()
+
+    def _run_rename_batch(self, directory, selected_indices, selected_files,
+                          propose, sanitizer, existing_names, extracted, extract_task):
+        """Executa o lote de renomeação em duas fases, fora da thread da UI.
+
+        Fase 1 move cada origem para um nome temporário único; fase 2
+        move os temporários para os nomes finais com os.replace (atômico).
+        Assim, renomeações cruzadas (a→b com b também selecionado) não
+        colidem, e a resolução de conflitos enxerga os nomes vagos.
+        """
+        renamed_count = 0
+        errors = []
+        renames = []  # (índice na listbox, nome antigo, nome novo)
+
+        # Qualquer exceção fora dos tratamentos por arquivo não pode
+        # matar a thread em silêncio: os botões ficariam desabilitados
+        # para sempre. O finally garante que a UI sempre é liberada.
+        try:
+            if extract_task is not None:
+                # I/O concorrente; 16 threads saturam um disco sem inundar
+                # um compartilhamento de rede (extract_many já limita ao
+                # número de arquivos). Strings concatenadas com os.path.join
+                # evitam construir um Path por arquivo.
+                join = os.path.join
+                extracted.update(self.extractor_manager.extract_many(
+                    [join(directory, f) for f in selected_files],
+                    max_workers=16,
+                    **extract_task
+                ))
+
+            # Amarrar os invariantes do loop em locais: cada lookup de
+            # atributo/global economizado se paga em seleções grandes.
+            splitext = os.path.splitext
+            sanitize = sanitizer.sanitize
+
+            # Fase 0: planejar. Arquivos cujo nome gerado é o próprio nome
+            # atual são descartados e mantêm seu nome reservado; os demais
+            # desocupam o nome antigo antes da resolução de conflitos.
+            pending = []
+            for i, filename in enumerate(selected_files):
+                try:
+                    name, ext = splitext(filename)
+                    proposed_new_name = propose(i, filename, name, ext)
+
+                    if proposed_new_name is None:
+                        errors.append(f"'{filename}': Não foi possível extrair conteúdo.")
+                        continue # Pula para o próximo arquivo
 
-            except Exception as e:
-                errors.append(f"Erro ao renomear '{filename}': {e}")
+                    if not proposed_new_name:
+                        # Nenhum nome novo foi gerado, pular para o próximo.
+                        continue
+
+                    if sanitize(proposed_new_name) == filename:
+                        # O nome final sanitizado é o mesmo que o original
+                        errors.append(f"'{filename}': O nome gerado ('{proposed_new_name}') resultou no nome original após a finalização.")
+                        continue
+
+                    pending.append((selected_indices[i], filename, proposed_new_name))
+                    existing_names.discard(filename)
+                except Exception as e:
+                    errors.append(f"Erro ao renomear '{filename}': {e}")
+
+            # Uma chamada em lote amortiza o overhead por nome; o conjunto é
+            # atualizado internamente, então nomes atribuídos no lote são
+            # vistos pelos seguintes.
+            final_names = sanitizer.sanitize_many(
+                [proposed for _, _, proposed in pending],
+                existing_names=existing_names
+            )
+            plan = [(idx, filename, final_new_name)
+                    for (idx, filename, _), final_new_name in zip(pending, final_names)]
+
+            join = os.path.join
+
+            # Com um descritor da pasta aberto, o kernel resolve apenas o
+            # nome em cada rename, sem re-percorrer o caminho do diretório
+            # duas vezes por arquivo (pathwalk pesa em sistemas de arquivos
+            # de rede). Indisponível no Windows → caminhos completos.
+            dir_fd = None
+            if os.rename in os.supports_dir_fd:
+                try:
+                    dir_fd = os.open(directory, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+                except OSError:
+                    dir_fd = None
+
+            if dir_fd is not None:
+                def move(src_name, dst_name):
+                    os.replace(src_name, dst_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+            else:
+                def move(src_name, dst_name):
+                    os.replace(join(directory, src_name), join(directory, dst_name))
+
+            try:
+                # Fase 1: origem → temporário único
+                staged = []
+                phase1_failed = set()
+                for idx, old_name, new_name in plan:
+                    # Truncar o prefixo para o temporário nunca estourar
+                    # NAME_MAX (255 *bytes*): 200 + len(".fr-tmp-") + 32 =
+                    # 240. O corte é medido em bytes codificados — nomes
+                    # multibyte (CJK, acentos) ocupam até 4 bytes por
+                    # caractere — e recua até uma fronteira de caractere.
+                    prefix = old_name
+                    if len(os.fsencode(prefix)) > 200:
+                        prefix = prefix[:200]
+                        while len(os.fsencode(prefix)) > 200:
+                            prefix = prefix[:-1]
+                    tmp_name = f"{prefix}.fr-tmp-{uuid.uuid4().hex}"
+                    try:
+                        move(old_name, tmp_name)
+                        staged.append((idx, old_name, tmp_name, new_name))
+                    except OSError as e:
+                        errors.append(f"Erro ao renomear '{old_name}': {e}")
+                        # O arquivo continua em old_name, mas o plano supôs
+                        # o nome vago: reservá-lo de novo para a fase 2 não
+                        # sobrescrever este arquivo com outro do lote.
+                        existing_names.add(old_name)
+                        phase1_failed.add(old_name)
+
+                # Fase 2: temporário → nome final
+                total = len(staged)
+                for done, (idx, old_name, tmp_name, new_name) in enumerate(staged, start=1):
+                    try:
+                        if new_name in phase1_failed:
+                            # O destino planejado voltou a estar ocupado por
+                            # um arquivo que falhou na fase 1; resolver um
+                            # novo nome livre em vez de sobrescrevê-lo.
+                            new_name = sanitize(new_name, existing_names=existing_names)
+                            existing_names.add(new_name)
+                        move(tmp_name, new_name)
+                        renames.append((idx, old_name, new_name))
+                        renamed_count += 1
+                    except OSError as e:
+                        errors.append(f"Erro ao renomear '{old_name}': {e}")
+                        # Restaurar com os.replace sobrescreveria quem quer
+                        # que ocupe old_name agora — outro arquivo do lote
+                        # pode tê-lo recebido (ou ainda vai recebê-lo) como
+                        # nome final. Se o nome está reivindicado, deixar o
+                        # arquivo no temporário e avisar.
+                        if old_name in existing_names:
+                            errors.append(f"'{old_name}': o nome original já foi usado por outro arquivo; arquivo ficou como '{tmp_name}'.")
+                        else:
+                            try:
+                                move(tmp_name, old_name)
+                                existing_names.add(old_name)
+                            except OSError:
+                                errors.append(f"'{old_name}': restaurar falhou; arquivo ficou como '{tmp_name}'.")
+                    if done % 100 == 0 or done == total:
+                        self.after(0, self._report_rename_progress, done, total)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+        except Exception as e:
+            errors.append(f"Erro inesperado: {e}")
+        finally:
+            self.after(0, self._finish_rename, renamed_count, errors, renames)
+
+    def _report_rename_progress(self, done, total):
+        self.title(f"Renomeador de Arquivos em Lote — {done}/{total}")
+
+    def _finish_rename(self, renamed_count, errors, renames):
+        """Aplica o resultado do lote na UI (thread principal)."""
+        self.title("Renomeador de Arquivos em Lote")
+        self.rename_button.config(state="normal")
+        self.browse_button.config(state="normal")
+
+        # Atualizar apenas as linhas alteradas em vez de relistar a
+        # pasta inteira e repopular a listbox do zero. A scrollbar fica
+        # desconectada durante as trocas (como em _finish_scan) e a
+        # posição de rolagem é restaurada ao final, evitando um recálculo
+        # de geometria por linha tocada.
+        prev_top = self.file_listbox.yview()[0]
+        self.file_listbox.config(yscrollcommand="")
+        try:
+            for idx, old_name, new_name in renames:
+                # A listbox espelha self.files, então o índice da linha é
+                # o mesmo da lista — sem busca linear por nome. Se a linha
+                # não corresponde mais ao nome antigo (listagem trocada),
+                # não tocar nela.
+                if not (0 <= idx < len(self.files) and self.files[idx] == old_name):
+                    continue
+                self.file_listbox.delete(idx)
+                self.file_listbox.insert(idx, new_name)
+                self.files[idx] = new_name
+        finally:
+            self.file_listbox.config(yscrollcommand=self.files_scrollbar.set)
+        self.file_listbox.selection_clear(0, "end")
+        self.file_listbox.yview_moveto(prev_top)
 
         # Feedback final
         message = f"{renamed_count} arquivo(s) renomeado(s) com sucesso."
@@ -279,8 +639,6 @@ class RenamerApp(tk.Tk):
         else:
             messagebox.showinfo("Sucesso", message)
 
-        self.load_files()
-
 if __name__ == "__main__":
     app = RenamerApp()
     app.mainloop()